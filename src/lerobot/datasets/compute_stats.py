@@ -63,11 +63,18 @@ class RunningQuantileStats:
         batch = batch.astype(np.result_type(batch.dtype, np.float32), copy=False)
         num_elements, vector_length = batch.shape
 
+        # Reduce the batch once and reuse the results for both initialization and the running update
+        batch_mean = np.mean(batch, axis=0)
+        batch_mean_of_squares = np.mean(np.square(batch), axis=0)
+        batch_min = np.min(batch, axis=0)
+        batch_max = np.max(batch, axis=0)
+
         if self._count == 0:
-            self._mean = np.mean(batch, axis=0)
-            self._mean_of_squares = np.mean(batch**2, axis=0)
-            self._min = np.min(batch, axis=0)
-            self._max = np.max(batch, axis=0)
+            self._count = num_elements
+            self._mean = batch_mean
+            self._mean_of_squares = batch_mean_of_squares
+            self._min = batch_min
+            self._max = batch_max
             self._histograms = [np.zeros(self._num_quantile_bins) for _ in range(vector_length)]
             self._bin_edges = [
                 np.linspace(self._min[i] - 1e-10, self._max[i] + 1e-10, self._num_quantile_bins + 1)
@@ -77,26 +84,21 @@ class RunningQuantileStats:
             if vector_length != self._mean.size:
                 raise ValueError("The length of new vectors does not match the initialized vector length.")
 
-            new_max = np.max(batch, axis=0)
-            new_min = np.min(batch, axis=0)
-            max_changed = np.any(new_max > self._max)
-            min_changed = np.any(new_min < self._min)
-            self._max = np.maximum(self._max, new_max)
-            self._min = np.minimum(self._min, new_min)
+            max_changed = np.any(batch_max > self._max)
+            min_changed = np.any(batch_min < self._min)
+            self._max = np.maximum(self._max, batch_max)
+            self._min = np.minimum(self._min, batch_min)
 
             if max_changed or min_changed:
                 self._adjust_histograms()
 
-        self._count += num_elements
-
-        batch_mean = np.mean(batch, axis=0)
-        batch_mean_of_squares = np.mean(batch**2, axis=0)
+            self._count += num_elements
 
-        # Update running mean and mean of squares
-        self._mean += (batch_mean - self._mean) * (num_elements / self._count)
-        self._mean_of_squares += (batch_mean_of_squares - self._mean_of_squares) * (
-            num_elements / self._count
-        )
+            # Update running mean and mean of squares
+            self._mean += (batch_mean - self._mean) * (num_elements / self._count)
+            self._mean_of_squares += (batch_mean_of_squares - self._mean_of_squares) * (
+                num_elements / self._count
+            )
 
         self._update_histograms(batch)
 
@@ -143,16 +145,11 @@ class RunningQuantileStats:
             )
 
             # Redistribute existing histogram counts to new bins
-            # We need to map each old bin center to the new bins
+            # We need to map each old bin center to the new bins, done for all bins at once
             old_centers = (old_edges[:-1] + old_edges[1:]) / 2
-            new_hist = np.zeros(self._num_quantile_bins)
-
-            for old_center, count in zip(old_centers, old_hist, strict=False):
-                if count > 0:
-                    # Find which new bin this old center belongs to
-                    bin_idx = np.searchsorted(new_edges, old_center) - 1
-                    bin_idx = max(0, min(bin_idx, self._num_quantile_bins - 1))
-                    new_hist[bin_idx] += count
+            bin_idx = np.searchsorted(new_edges, old_centers) - 1
+            bin_idx = np.clip(bin_idx, 0, self._num_quantile_bins - 1)
+            new_hist = np.bincount(bin_idx, weights=old_hist, minlength=self._num_quantile_bins)
 
             self._histograms[i] = new_hist
             self._bin_edges[i] = new_edges
@@ -165,21 +162,22 @@ class RunningQuantileStats:
 
     def _compute_quantiles(self) -> list[np.ndarray]:
         """Compute quantiles based on histograms."""
+        # The cumulative counts only depend on the histogram, so compute them once for all quantiles
+        cumsums = [np.cumsum(hist) for hist in self._histograms]
         results = []
         for q in self._quantile_list:
             target_count = q * self._count
             q_values = []
 
-            for hist, edges in zip(self._histograms, self._bin_edges, strict=True):
-                q_value = self._compute_single_quantile(hist, edges, target_count)
+            for cumsum, edges in zip(cumsums, self._bin_edges, strict=True):
+                q_value = self._compute_single_quantile(cumsum, edges, target_count)
                 q_values.append(q_value)
 
             results.append(np.array(q_values))
         return results
 
-    def _compute_single_quantile(self, hist: np.ndarray, edges: np.ndarray, target_count: float) -> float:
-        """Compute a single quantile value from histogram and bin edges."""
-        cumsum = np.cumsum(hist)
+    def _compute_single_quantile(self, cumsum: np.ndarray, edges: np.ndarray, target_count: float) -> float:
+        """Compute a single quantile value from cumulative histogram counts and bin edges."""
         idx = np.searchsorted(cumsum, target_count)
 
         if idx == 0:
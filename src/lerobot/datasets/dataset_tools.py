@@ -33,6 +33,7 @@ from pathlib import Path
 import datasets
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pyarrow.parquet as pq
 import torch
 from tqdm import tqdm
@@ -97,9 +98,10 @@ def _load_episode_with_stats(src_dataset: LeRobotDataset, episode_idx: int) -> d
     file_idx = ep_meta["meta/episodes/file_index"]
 
     parquet_path = src_dataset.root / DEFAULT_EPISODES_PATH.format(chunk_index=chunk_idx, file_index=file_idx)
-    df = pd.read_parquet(parquet_path)
+    # Push the episode filter down to the parquet reader instead of materializing every row of the file.
+    df = pd.read_parquet(parquet_path, filters=[("episode_index", "==", episode_idx)])
 
-    episode_row = df[df["episode_index"] == episode_idx].iloc[0]
+    episode_row = df.iloc[0]
 
     return episode_row.to_dict()
 
@@ -541,7 +543,7 @@ def _copy_and_reindex_data(
     if dst_meta.tasks is None:
         all_task_indices = set()
         for src_path in file_to_episodes:
-            df = pd.read_parquet(src_dataset.root / src_path)
+            df = pd.read_parquet(src_dataset.root / src_path, columns=["episode_index", "task_index"])
             mask = df["episode_index"].isin(list(episode_mapping.keys()))
             task_series: pd.Series = df[mask]["task_index"]
             all_task_indices.update(task_series.unique().tolist())
@@ -1559,6 +1561,24 @@ def modify_tasks(
     return dataset
 
 
+def _column_to_numpy(column: pa.ChunkedArray) -> np.ndarray:
+    """Materialize a parquet column as a single array without a per-row Python loop.
+
+    List columns holding same-length rows (e.g. `observation.state`) are flattened straight from the Arrow
+    buffers and reshaped to (num_rows, length), instead of stacking one small array per row.
+    """
+    array = column.combine_chunks()
+    if pa.types.is_fixed_size_list(array.type) and not pa.types.is_nested(array.type.value_type):
+        return array.flatten().to_numpy(zero_copy_only=False).reshape(len(array), array.type.list_size)
+    if pa.types.is_list(array.type) and not pa.types.is_nested(array.type.value_type):
+        lengths = np.diff(array.offsets.to_numpy())
+        if len(lengths) > 0 and (lengths == lengths[0]).all():
+            return array.flatten().to_numpy(zero_copy_only=False).reshape(len(array), lengths[0])
+    if pa.types.is_nested(array.type):
+        return np.stack(array.to_numpy(zero_copy_only=False))
+    return array.to_numpy(zero_copy_only=False)
+
+
 def recompute_stats(
     dataset: LeRobotDataset,
     skip_image_video: bool = True,
@@ -1630,18 +1650,18 @@ def recompute_stats(
     numeric_keys = [k for k, v in features_to_compute.items() if v["dtype"] not in ["image", "video"]]
 
     for parquet_path in tqdm(parquet_files, desc="Computing stats from data files"):
-        df = pd.read_parquet(parquet_path)
-
-        for ep_idx in sorted(df["episode_index"].unique()):
-            ep_df = df[df["episode_index"] == ep_idx]
-            episode_data = {}
-            for key in numeric_keys:
-                if key in ep_df.columns:
-                    values = ep_df[key].values
-                    if hasattr(values[0], "__len__"):
-                        episode_data[key] = np.stack(values)
-                    else:
-                        episode_data[key] = np.array(values)
+        # Only decode the columns we need, so image columns embedded in the parquet files are never read
+        available = set(pq.read_schema(parquet_path).names)
+        keys = [key for key in numeric_keys if key in available]
+        table = pq.read_table(parquet_path, columns=[*keys, "episode_index"])
+        columns = {key: _column_to_numpy(table[key]) for key in keys}
+        episode_index = table["episode_index"].to_numpy()
+
+        # Episodes are stored contiguously, so each one is a view into the file-level arrays instead of a
+        # boolean-masked copy per episode.
+        starts = np.concatenate(([0], np.nonzero(np.diff(episode_index))[0] + 1))
+        for start, stop in zip(starts, np.append(starts[1:], len(episode_index)), strict=True):
+            episode_data = {key: values[start:stop] for key, values in columns.items()}
 
             ep_stats = compute_episode_stats(episode_data, features_to_compute)
             all_episode_stats.append(ep_stats)
@@ -374,10 +374,10 @@ class RangeFinderGUI:
                 for s in self.sliders:
                     s.handle_event(e)
 
-            # live goal write while dragging
-            for s in self.sliders:
-                if s.drag_pos:
-                    self.bus.write("Goal_Position", s.motor, s.pos_v, normalize=False)
+            # live goal write while dragging, batched into a single bus transaction
+            goals = {s.motor: s.pos_v for s in self.sliders if s.drag_pos}
+            if goals:
+                self.bus.sync_write("Goal_Position", goals, normalize=False)
 
             # tick update
             for s in self.sliders:
@@ -238,7 +238,6 @@ class DamiaoMotorsBus(MotorsBusBase):
                 missing_motors.append(motor_name)
             else:
                 self._process_response(motor_name, msg)
-            time.sleep(MEDIUM_TIMEOUT_SEC)
 
         if missing_motors:
             raise ConnectionError(
@@ -271,10 +270,9 @@ class DamiaoMotorsBus(MotorsBusBase):
     def configure_motors(self) -> None:
         """Configure all motors with default settings."""
         # Damiao motors don't require much configuration in MIT mode
-        # Just ensure they're enabled
+        # Just ensure they're enabled. Each command already waits for the motor's reply, so no extra delay.
         for motor in self.motors:
             self._send_simple_command(motor, CAN_CMD_ENABLE)
-            time.sleep(MEDIUM_TIMEOUT_SEC)
 
     def _send_simple_command(self, motor: NameOrID, command_byte: int) -> None:
         """Helper to send simple 8-byte commands (Enable, Disable, Zero)."""
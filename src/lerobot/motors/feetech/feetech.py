@@ -383,11 +383,7 @@ class FeetechMotorsBus(SerialMotorsBus):
 
             if idx == 0:  # found at the beginning of the packet
                 # calculate checksum
-                checksum = 0
-                for idx in range(2, status_length - 1):  # except header & checksum
-                    checksum += rxpacket[idx]
-
-                checksum = ~checksum & 0xFF
+                checksum = ~sum(rxpacket[2 : status_length - 1]) & 0xFF  # except header & checksum
                 if rxpacket[status_length - 1] == checksum:
                     result = scs.COMM_SUCCESS
                     data_list[rxpacket[scs.PKT_ID]] = rxpacket[scs.PKT_ERROR]
@@ -530,7 +530,8 @@ class SerialMotorsBus(MotorsBusBase):
         try:
             if not self.port_handler.openPort():
                 raise OSError(f"Failed to open port '{self.port}'.")
-            elif handshake:
+            self._enable_low_latency_mode()
+            if handshake:
                 self._handshake()
         except (FileNotFoundError, OSError, serial.SerialException) as e:
             raise ConnectionError(
@@ -538,6 +539,18 @@ class SerialMotorsBus(MotorsBusBase):
                 "\nTry running `lerobot-find-port`\n"
             ) from e
 
+    def _enable_low_latency_mode(self) -> None:
+        """Ask the serial driver to flush incoming bytes immediately instead of batching them.
+
+        USB-serial adapters (FTDI, CH340, CDC-ACM) otherwise buffer replies for up to 16 ms, which dominates
+        the round-trip time of the small status packets exchanged with the motors. This is best-effort:
+        the flag only exists on Linux and is rejected by some drivers and virtual ports.
+        """
+        try:
+            self.port_handler.ser.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, OSError, ValueError) as e:
+            logger.debug(f"Could not enable low latency mode on port '{self.port}': {e}")
+
     @abc.abstractmethod
     def _handshake(self) -> None:
         pass
@@ -724,6 +737,9 @@ class SerialMotorsBus(MotorsBusBase):
             if self.port_handler.getBaudRate() != baudrate:
                 raise RuntimeError("Failed to write bus baud rate.")
 
+            # Changing the baud rate reopens the underlying serial port, which resets the latency flag.
+            self._enable_low_latency_mode()
+
     @property
     @abc.abstractmethod
     def is_calibrated(self) -> bool:
@@ -829,10 +845,16 @@ class SerialMotorsBus(MotorsBusBase):
             maxes = {motor: max(positions[motor], max_) for motor, max_ in maxes.items()}
 
             if display_values:
-                print("\n-------------------------------------------")
-                print(f"{'NAME':<15} | {'MIN':>6} | {'POS':>6} | {'MAX':>6}")
-                for motor in motor_names:
-                    print(f"{motor:<15} | {mins[motor]:>6} | {positions[motor]:>6} | {maxes[motor]:>6}")
+                # Format the whole table first so each refresh is a single write to the terminal
+                table = [
+                    "\n-------------------------------------------",
+                    f"{'NAME':<15} | {'MIN':>6} | {'POS':>6} | {'MAX':>6}",
+                    *(
+                        f"{motor:<15} | {mins[motor]:>6} | {positions[motor]:>6} | {maxes[motor]:>6}"
+                        for motor in motor_names
+                    ),
+                ]
+                print("\n".join(table), flush=True)
 
             if enter_pressed():
                 user_pressed_enter = True
@@ -854,20 +876,22 @@ class SerialMotorsBus(MotorsBusBase):
         normalized_values = {}
         for id_, val in ids_values.items():
             motor = self._id_to_name(id_)
-            min_ = self.calibration[motor].range_min
-            max_ = self.calibration[motor].range_max
-            drive_mode = self.apply_drive_mode and self.calibration[motor].drive_mode
+            calibration = self.calibration[motor]
+            norm_mode = self.motors[motor].norm_mode
+            min_ = calibration.range_min
+            max_ = calibration.range_max
+            drive_mode = self.apply_drive_mode and calibration.drive_mode
             if max_ == min_:
                 raise ValueError(f"Invalid calibration for motor '{motor}': min and max are equal.")
 
             bounded_val = min(max_, max(min_, val))
-            if self.motors[motor].norm_mode is MotorNormMode.RANGE_M100_100:
+            if norm_mode is MotorNormMode.RANGE_M100_100:
                 norm = (((bounded_val - min_) / (max_ - min_)) * 200) - 100
                 normalized_values[id_] = -norm if drive_mode else norm
-            elif self.motors[motor].norm_mode is MotorNormMode.RANGE_0_100:
+            elif norm_mode is MotorNormMode.RANGE_0_100:
                 norm = ((bounded_val - min_) / (max_ - min_)) * 100
                 normalized_values[id_] = 100 - norm if drive_mode else norm
-            elif self.motors[motor].norm_mode is MotorNormMode.DEGREES:
+            elif norm_mode is MotorNormMode.DEGREES:
                 mid = (min_ + max_) / 2
                 max_res = self.model_resolution_table[self._id_to_model(id_)] - 1
                 normalized_values[id_] = (val - mid) * 360 / max_res
@@ -883,21 +907,23 @@ class SerialMotorsBus(MotorsBusBase):
         unnormalized_values = {}
         for id_, val in ids_values.items():
             motor = self._id_to_name(id_)
-            min_ = self.calibration[motor].range_min
-            max_ = self.calibration[motor].range_max
-            drive_mode = self.apply_drive_mode and self.calibration[motor].drive_mode
+            calibration = self.calibration[motor]
+            norm_mode = self.motors[motor].norm_mode
+            min_ = calibration.range_min
+            max_ = calibration.range_max
+            drive_mode = self.apply_drive_mode and calibration.drive_mode
             if max_ == min_:
                 raise ValueError(f"Invalid calibration for motor '{motor}': min and max are equal.")
 
-            if self.motors[motor].norm_mode is MotorNormMode.RANGE_M100_100:
+            if norm_mode is MotorNormMode.RANGE_M100_100:
                 val = -val if drive_mode else val
                 bounded_val = min(100.0, max(-100.0, val))
                 unnormalized_values[id_] = int(((bounded_val + 100) / 200) * (max_ - min_) + min_)
-            elif self.motors[motor].norm_mode is MotorNormMode.RANGE_0_100:
+            elif norm_mode is MotorNormMode.RANGE_0_100:
                 val = 100 - val if drive_mode else val
                 bounded_val = min(100.0, max(0.0, val))
                 unnormalized_values[id_] = int((bounded_val / 100) * (max_ - min_) + min_)
-            elif self.motors[motor].norm_mode is MotorNormMode.DEGREES:
+            elif norm_mode is MotorNormMode.DEGREES:
                 mid = (min_ + max_) / 2
                 max_res = self.model_resolution_table[self._id_to_model(id_)] - 1
                 unnormalized_values[id_] = int((val * max_res / 360) + mid)
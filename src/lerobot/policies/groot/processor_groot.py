@@ -738,8 +738,13 @@ def _iter_action_state_training_samples(dataset: Any):
         if reader.hf_dataset is None:
             reader.load_and_activate()
         delta_indices = getattr(reader, "delta_indices", None)
+        # Only decode the columns needed here, so embedded image columns are never loaded.
+        needed_columns = [ACTION, OBS_STATE, "episode_index", "index"]
+        hf_dataset = reader.hf_dataset.select_columns(
+            [key for key in needed_columns if key in reader.hf_dataset.column_names]
+        )
         for idx in range(len(dataset)):
-            item = reader.hf_dataset[idx]
+            item = hf_dataset[idx]
             action = item.get(ACTION)
             state = item.get(OBS_STATE)
             pad_mask = None
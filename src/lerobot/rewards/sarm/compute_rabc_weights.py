@@ -49,8 +49,6 @@ import argparse
 import logging
 from pathlib import Path
 
-import matplotlib.gridspec as gridspec
-import matplotlib.pyplot as plt
 import numpy as np
 import pyarrow as pa
 import pyarrow.parquet as pq
@@ -141,12 +139,16 @@ def visualize_episode(
 
     Same as sarm_inference_visualization.py
     """
+    from matplotlib import colormaps
+    from matplotlib.figure import Figure
+
     num_stages = stage_preds.shape[1]
-    colors = plt.cm.tab10(np.linspace(0, 1, num_stages))
+    colors = colormaps["tab10"](np.linspace(0, 1, num_stages))
     frame_indices = np.arange(len(progress_preds))
 
-    fig = plt.figure(figsize=(14, 12))
-    gs = gridspec.GridSpec(3, 1, height_ratios=[2, 1, 1], hspace=0.3)
+    # Render straight to the Agg canvas of a standalone Figure: no pyplot state and no GUI backend to load
+    fig = Figure(figsize=(14, 12))
+    gs = fig.add_gridspec(3, 1, height_ratios=[2, 1, 1], hspace=0.3)
     ax_progress, ax_stages, ax_frames = fig.add_subplot(gs[0]), fig.add_subplot(gs[1]), fig.add_subplot(gs[2])
 
     # Progress plot
@@ -204,8 +206,7 @@ def visualize_episode(
     ax_frames.set_title("Sample Frames", pad=20)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, dpi=150, bbox_inches="tight")
-    plt.close()
+    fig.savefig(output_path, dpi=150, bbox_inches="tight")
     print(f"Saved: {output_path}")
 
 
@@ -655,8 +655,11 @@ class ReplayBuffer:
         if not has_done_key:
             print("'next.done' key not found in dataset. Inferring from episode boundaries...")
 
+        # Each frame is decoded once: the lookahead sample becomes the next iteration's current sample.
+        next_sample = sample
         for i in tqdm(range(num_frames)):
-            current_sample = dataset[i]
+            current_sample = next_sample
+            next_sample = dataset[i + 1] if i < num_frames - 1 else None
 
             # ----- 1) Current state -----
             current_state: dict[str, torch.Tensor] = {}
@@ -676,12 +679,8 @@ class ReplayBuffer:
             else:
                 # If this is the last frame or if next frame is in a different episode, mark as done
                 done = False
-                if i == num_frames - 1:
+                if next_sample is None or next_sample["episode_index"] != current_sample["episode_index"]:
                     done = True
-                elif i < num_frames - 1:
-                    next_sample = dataset[i + 1]
-                    if next_sample["episode_index"] != current_sample["episode_index"]:
-                        done = True
 
             # TODO: (azouitine) Handle truncation (using the same value as done for now)
             truncated = done
@@ -690,15 +689,17 @@ class ReplayBuffer:
             # If not done and the next sample is in the same episode, we pull the next sample's state.
             # Otherwise (done=True or next sample crosses to a new episode), next_state = current_state.
             next_state = current_state  # default
-            if not done and (i < num_frames - 1):
-                next_sample = dataset[i + 1]
-                if next_sample["episode_index"] == current_sample["episode_index"]:
-                    # Build next_state from the same keys
-                    next_state_data: dict[str, torch.Tensor] = {}
-                    for key in state_keys:
-                        val = next_sample[key]
-                        next_state_data[key] = val.unsqueeze(0)  # Add batch dimension
-                    next_state = next_state_data
+            if (
+                not done
+                and next_sample is not None
+                and next_sample["episode_index"] == current_sample["episode_index"]
+            ):
+                # Build next_state from the same keys
+                next_state_data: dict[str, torch.Tensor] = {}
+                for key in state_keys:
+                    val = next_sample[key]
+                    next_state_data[key] = val.unsqueeze(0)  # Add batch dimension
+                next_state = next_state_data
 
             # ----- 5) Complementary info (if available) -----
             complementary_info = None
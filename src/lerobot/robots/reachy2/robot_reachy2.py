@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 import time
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from lerobot.cameras import make_cameras_from_configs
@@ -99,7 +100,7 @@ class Reachy2Robot(Robot):
     def observation_features(self) -> dict[str, Any]:
         return {**self.motors_features, **self.camera_features}
 
-    @property
+    @cached_property
     def action_features(self) -> dict[str, type]:
         return self.motors_features
 
@@ -107,7 +108,7 @@ class Reachy2Robot(Robot):
     def camera_features(self) -> dict[str, tuple[int | None, int | None, int]]:
         return {cam: (self.cameras[cam].height, self.cameras[cam].width, 3) for cam in self.cameras}
 
-    @property
+    @cached_property
     def motors_features(self) -> dict[str, type]:
         if self.config.with_mobile_base:
             return {
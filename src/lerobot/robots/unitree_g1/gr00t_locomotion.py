@@ -16,10 +16,11 @@
 
 import logging
 from collections import deque
+from pathlib import Path
 
 import numpy as np
 import onnxruntime as ort
-from huggingface_hub import hf_hub_download
+from huggingface_hub import snapshot_download
 
 from .g1_utils import (
     REMOTE_AXES,
@@ -58,19 +59,14 @@ def load_groot_policies(
     """
     logger.info(f"Loading GR00T dual-policy system from the hub ({repo_id})...")
 
-    # Download ONNX policies from Hugging Face Hub
-    balance_path = hf_hub_download(
-        repo_id=repo_id,
-        filename="GR00T-WholeBodyControl-Balance.onnx",
-    )
-    walk_path = hf_hub_download(
-        repo_id=repo_id,
-        filename="GR00T-WholeBodyControl-Walk.onnx",
-    )
+    # Download both ONNX policies from Hugging Face Hub concurrently
+    balance_filename = "GR00T-WholeBodyControl-Balance.onnx"
+    walk_filename = "GR00T-WholeBodyControl-Walk.onnx"
+    policy_dir = Path(snapshot_download(repo_id=repo_id, allow_patterns=[balance_filename, walk_filename]))
 
     # Load ONNX policies
-    policy_balance = ort.InferenceSession(balance_path)
-    policy_walk = ort.InferenceSession(walk_path)
+    policy_balance = ort.InferenceSession(str(policy_dir / balance_filename))
+    policy_walk = ort.InferenceSession(str(policy_dir / walk_filename))
 
     logger.info("GR00T policies loaded successfully")
 
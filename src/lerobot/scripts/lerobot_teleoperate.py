@@ -184,6 +184,7 @@ def teleop_loop(
     """
 
     display_len = max(len(key) for key in robot.action_features)
+    display_header = "\n" + "-" * (display_len + 10) + "\n" + f"{'NAME':<{display_len}} | {'NORM':>7}"
     start = time.perf_counter()
     while True:
         loop_start = time.perf_counter()
@@ -220,11 +221,11 @@ def teleop_loop(
                 compress_images=display_compressed_images,
             )
 
-            print("\n" + "-" * (display_len + 10))
-            print(f"{'NAME':<{display_len}} | {'NORM':>7}")
-            # Display the final robot action that was sent
-            for motor, value in robot_action_to_send.items():
-                print(f"{motor:<{display_len}} | {value:>7.2f}")
+            # Display the final robot action that was sent, written to the terminal in one go
+            rows = [
+                f"{motor:<{display_len}} | {value:>7.2f}" for motor, value in robot_action_to_send.items()
+            ]
+            print("\n".join([display_header, *rows]))
             move_cursor_up(len(robot_action_to_send) + 3)
 
         dt_s = time.perf_counter() - loop_start
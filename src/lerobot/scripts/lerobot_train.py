@@ -29,6 +29,7 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from accelerate import Accelerator
 
+import numpy as np
 import torch
 from termcolor import colored
 from torch.optim import Optimizer
@@ -480,13 +481,14 @@ def train(cfg: TrainPipelineConfig, accelerator: "Accelerator | None" = None):
         eval_ds = eval_dataset
         if cfg.max_eval_samples > 0 and hasattr(eval_dataset, "hf_dataset"):
             task_arr = eval_dataset.hf_dataset.data.column("task_index").to_numpy()
-            unique_tasks = sorted(set(task_arr.tolist()))
+            unique_tasks, task_counts = np.unique(task_arr, return_counts=True)
             per_task = max(1, cfg.max_eval_samples // len(unique_tasks))
-            selected: list[int] = []
-            for t in unique_tasks:
-                frames = (task_arr == t).nonzero()[0][:per_task]
-                selected.extend(frames.tolist())
-            eval_ds = torch.utils.data.Subset(eval_dataset, selected)
+            # Group frames by task (frame order is kept within a task) and keep the first `per_task` of each
+            order = np.argsort(task_arr, kind="stable")
+            task_starts = np.cumsum(task_counts) - task_counts
+            rank_in_task = np.arange(len(order)) - np.repeat(task_starts, task_counts)
+            selected = order[rank_in_task < per_task]
+            eval_ds = torch.utils.data.Subset(eval_dataset, selected.tolist())
 
         eval_collate_fn = lerobot_collate_fn if dataset.meta.has_language_columns else None
         eval_dataloader = torch.utils.data.DataLoader(
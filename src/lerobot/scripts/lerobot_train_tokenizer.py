@@ -103,29 +103,6 @@ class TokenizerTrainingConfig:
     hub_private: bool = False
 
 
-def apply_relative_transform(
-    state: np.ndarray, actions: np.ndarray, relative_dims: list[int] | None
-) -> np.ndarray:
-    """Apply relative transform to specified dimensions.
-
-    Args:
-        state: Current state [D]
-        actions: Future actions [D]
-        relative_dims: List of dimension indices to apply relative transform to
-
-    Returns:
-        Transformed actions [D]
-    """
-    if relative_dims is None or len(relative_dims) == 0:
-        return actions
-
-    relative_actions = actions.copy()
-    for dim in relative_dims:
-        relative_actions[dim] = actions[dim] - state[dim]
-
-    return relative_actions
-
-
 def apply_normalization(
     data: np.ndarray,
     stats: dict[str, np.ndarray],
@@ -238,30 +215,17 @@ def process_episode(args):
 
         # create action chunks (sliding window)
         # all actions in a chunk are relative to the FIRST state in that chunk
-        action_chunks = []
-
-        for i in range(len(states) - action_horizon + 1):
-            current_state = states[i]  # First state in chunk
-            future_absolute_actions = actions[i : i + action_horizon]
-
-            if use_relative_transform:
-                # relative actions
-                relative_chunk = np.zeros_like(future_absolute_actions)
-                for t in range(action_horizon):
-                    relative_chunk[t] = apply_relative_transform(
-                        current_state,
-                        future_absolute_actions[t],
-                        relative_dims,
-                    )
-                action_chunks.append(relative_chunk)
-            else:
-                # absolute actions (no relative transform)
-                action_chunks.append(future_absolute_actions)
+        # (num_chunks, action_horizon, action_dim) windows built in one copy instead of a loop per chunk
+        action_chunks = np.lib.stride_tricks.sliding_window_view(actions, action_horizon, axis=0)
+        action_chunks = action_chunks.swapaxes(1, 2).copy()
 
         if len(action_chunks) == 0:
             return None
 
-        action_chunks = np.array(action_chunks)
+        if use_relative_transform and relative_dims:
+            # relative actions
+            first_states = states[: len(action_chunks), None, relative_dims]
+            action_chunks[:, :, relative_dims] -= first_states
 
         # sample chunks
         if sample_fraction < 1.0:
@@ -18,6 +18,7 @@
 from unittest.mock import patch
 
 import numpy as np
+import pandas as pd
 import pytest
 import torch
 
@@ -32,6 +33,7 @@ from lerobot.datasets.dataset_tools import (
     merge_datasets,
     modify_features,
     modify_tasks,
+    recompute_stats,
     reencode_dataset,
     remove_feature,
     split_dataset,
@@ -1228,6 +1230,21 @@ def test_modify_tasks_keeps_original_when_not_overridden(sample_dataset):
     assert modified_dataset.meta.episodes[4]["tasks"][0] == "New Task A"
 
 
+def test_recompute_stats_matches_data_files(sample_dataset):
+    """Test that recomputed numeric stats match the values stored in the data files."""
+    data_files = sorted((sample_dataset.root / "data").glob("*/*.parquet"))
+    df = pd.concat([pd.read_parquet(path) for path in data_files])
+
+    recompute_stats(sample_dataset)
+
+    for key in ["action", "observation.state"]:
+        values = np.stack(df[key].to_numpy())
+        stats = sample_dataset.meta.stats[key]
+        np.testing.assert_allclose(stats["mean"], values.mean(axis=0), rtol=1e-5, atol=1e-6)
+        np.testing.assert_allclose(stats["min"], values.min(axis=0))
+        np.testing.assert_allclose(stats["max"], values.max(axis=0))
+
+
 def test_convert_image_to_video_dataset(tmp_path):
     """Test converting lerobot/pusht_image dataset to video format."""
     from lerobot.datasets.lerobot_dataset import LeRobotDataset